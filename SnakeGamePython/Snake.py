@@ -1,12 +1,28 @@
 import tkinter as tk
 import random
+import time
 import collections # Used for deque for efficient snake body management
 
+try:
+    from numba import njit # Optional: JIT-compiles the numeric step function
+except ImportError:
+    njit = None
+
 # --- Game Constants ---
 GRID_SIZE = 20      # Size of each cell in pixels
 WIDTH = 600         # Canvas width in pixels (must be a multiple of GRID_SIZE)
 HEIGHT = 400        # Canvas height in pixels (must be a multiple of GRID_SIZE)
 GAME_SPEED = 150    # Milliseconds between each game update (lower is faster)
+CELLS_X = WIDTH // GRID_SIZE   # Board width in grid cells
+CELLS_Y = HEIGHT // GRID_SIZE  # Board height in grid cells
+MAX_CELLS = CELLS_X * CELLS_Y  # Board size; hard cap on snake length
+
+# When True, each tick renders the whole board into one PhotoImage and
+# blits it with a single canvas item, so Tk-side draw cost is constant
+# regardless of snake length. Useful for very long snakes or a reduced
+# GRID_SIZE; the default incremental per-item renderer is lighter for
+# normal play.
+FRAME_RENDER = False
 
 # Colors
 BACKGROUND_COLOR = "#000000"  # Black
@@ -15,6 +31,50 @@ FOOD_COLOR = "#FF0000"        # Red
 TEXT_COLOR = "#FFFFFF"        # White
 GAME_OVER_COLOR = "#FFD700"   # Gold
 
+# Movement lookup tables (avoid per-tick if/elif chains). Deltas are in
+# grid units; positions are only scaled by GRID_SIZE at draw time.
+DIRECTION_DELTAS = {
+    'Up': (0, -1),
+    'Down': (0, 1),
+    'Left': (-1, 0),
+    'Right': (1, 0),
+}
+OPPOSITES = {'Left': 'Right', 'Right': 'Left', 'Up': 'Down', 'Down': 'Up'}
+
+
+def _cell_key(col, row):
+    """
+    Packs a (col, row) grid coordinate into a single small int key.
+
+    Hashing one int is cheaper than hashing a coordinate tuple (two
+    PyObject hashes plus the tuple combine), so the occupancy and
+    free-cell sets store these keys instead of coordinate pairs.
+    """
+    return col * CELLS_Y + row
+
+
+def _step_head(head_x, head_y, dx, dy, width, height):
+    """
+    Advances the head by one cell and tests it against the walls.
+
+    Pure integer arithmetic, kept at module level so it can be
+    JIT-compiled by Numba when available (Tk drawing stays in Python).
+
+    Returns:
+        (new_x, new_y, hit_wall) for the advanced head position.
+    """
+    new_x = head_x + dx
+    new_y = head_y + dy
+    # Branchless bounds check: any of the four range violations makes one
+    # of these terms negative, so a single sign test replaces four
+    # comparisons (relies on two's-complement sign propagation through |).
+    hit_wall = (new_x | new_y | (width - 1 - new_x) | (height - 1 - new_y)) < 0
+    return new_x, new_y, hit_wall
+
+
+if njit is not None:
+    _step_head = njit(cache=True)(_step_head)
+
 class SnakeGame:
     def __init__(self, master):
         """
@@ -38,23 +98,40 @@ class SnakeGame:
         self.canvas = tk.Canvas(master, bg=BACKGROUND_COLOR, width=WIDTH, height=HEIGHT)
         self.canvas.pack(pady=10)
 
+        # Off-screen frame buffer for FRAME_RENDER mode
+        self._photo = tk.PhotoImage(width=WIDTH, height=HEIGHT) if FRAME_RENDER else None
+        self._frame_item = None
+
         # Score display
         self.score_label = tk.Label(master, text="Score: 0", fg=TEXT_COLOR, bg=BACKGROUND_COLOR, font=("Inter", 16, "bold"))
         self.score_label.pack()
 
         # Game state variables
-        self.snake = collections.deque() # Using deque for efficient append/pop from both ends
+        # Deque for efficient append/pop from both ends. Length is bounded
+        # by MAX_CELLS (the snake cannot outgrow the board), so its block
+        # allocation stays small and stable even in a maximal game.
+        self.snake = collections.deque()
+        self.snake_set = set()           # Packed keys of occupied cells for O(1) membership tests
+        self.snake_items = collections.deque() # Canvas item IDs, parallel to self.snake
+        self.free_cells = set()          # Packed keys of cells not occupied by the snake
         self.food = None
+        self._food_dirty = True          # True when the food oval needs redrawing
+        self._just_vacated = None        # Cell the tail vacated on the previous tick
         self.direction = 'Right' # Initial direction
+        self.pending_direction = None     # Buffered key press, applied once per tick
+        self.last_moved_direction = 'Right' # Direction the snake actually moved last tick
         self.score = 0
         self.game_over_state = False
         self.game_running = False # To control the game loop
 
-        # Bind arrow keys for movement
-        self.master.bind("<Left>", lambda event: self.change_direction('Left'))
-        self.master.bind("<Right>", lambda event: self.change_direction('Right'))
-        self.master.bind("<Up>", lambda event: self.change_direction('Up'))
-        self.master.bind("<Down>", lambda event: self.change_direction('Down'))
+        # Cache the bound scheduling method so game_loop avoids re-resolving
+        # master.after every tick
+        self._schedule = self.master.after
+
+        # Bind arrow keys for movement (one handler per direction, created once)
+        for sequence, direction in (('<Left>', 'Left'), ('<Right>', 'Right'),
+                                    ('<Up>', 'Up'), ('<Down>', 'Down')):
+            self.master.bind(sequence, lambda event, d=direction: self.change_direction(d))
         # Bind 'R' key for restart
         self.master.bind("<r>", lambda event: self.reset_game())
 
@@ -88,16 +165,27 @@ class SnakeGame:
             self.game_running = False
 
         self.canvas.delete("all") # Clear all drawn objects
+        self._frame_item = None   # Blit target was deleted with the rest
         self.snake.clear()        # Clear snake segments
+        self.snake_set.clear()    # Clear occupancy set
         self.food = None          # Clear food
+        self._just_vacated = None
 
-        # Initial snake position (start in the middle, 3 segments)
-        head_x = (WIDTH // 2 // GRID_SIZE) * GRID_SIZE
-        head_y = (HEIGHT // 2 // GRID_SIZE) * GRID_SIZE
+        # Initial snake position (start in the middle, 3 segments).
+        # Positions are (col, row) grid cells, not pixels.
+        head_col = CELLS_X // 2
+        head_row = CELLS_Y // 2
+        self.free_cells = set(range(MAX_CELLS))
         for i in range(3):
-            self.snake.appendleft((head_x - i * GRID_SIZE, head_y))
+            segment = (head_col - i, head_row)
+            key = _cell_key(*segment)
+            self.snake.appendleft(segment)
+            self.snake_set.add(key)
+            self.free_cells.discard(key)
 
         self.direction = 'Right'
+        self.pending_direction = None
+        self.last_moved_direction = 'Right'
         self.score = 0
         self.score_label.config(text=f"Score: {self.score}")
         self.game_over_state = False
@@ -117,115 +205,190 @@ class SnakeGame:
             self.game_over_state = False # Ensure game over state is false
             self.start_button.config(state=tk.DISABLED) # Disable start button once game begins
             self.reset_button.config(state=tk.NORMAL) # Enable reset button
+            self._next_deadline = time.monotonic() + GAME_SPEED / 1000
             self.game_loop()
 
     def create_objects(self):
         """
-        Draws the snake and food on the canvas.
+        Draws the snake and food on the canvas from scratch.
+
+        Only needed for full redraws (e.g. after a reset); per-tick
+        drawing is done incrementally in move_snake.
         """
+        if FRAME_RENDER:
+            self.render_frame()
+            return
+
         self.canvas.delete("snake") # Delete old snake segments
-        for x, y in self.snake:
-            self.canvas.create_rectangle(x, y, x + GRID_SIZE, y + GRID_SIZE,
-                                         fill=SNAKE_COLOR, tags="snake", outline="black")
+        self.snake_items.clear()
+        for col, row in self.snake:
+            x, y = col * GRID_SIZE, row * GRID_SIZE
+            item = self.canvas.create_rectangle(x, y, x + GRID_SIZE, y + GRID_SIZE,
+                                                fill=SNAKE_COLOR, tags="snake", outline="black")
+            self.snake_items.append(item) # Same head-to-tail order as self.snake
+
+    def draw_food(self):
+        """
+        Redraws the food oval if its position changed since the last draw.
 
+        Called from place_food, so the canvas is only touched when the
+        food actually moved.
+        """
+        if not self._food_dirty:
+            return
         self.canvas.delete("food") # Delete old food
         if self.food:
-            x, y = self.food
+            col, row = self.food
+            x, y = col * GRID_SIZE, row * GRID_SIZE
             self.canvas.create_oval(x, y, x + GRID_SIZE, y + GRID_SIZE,
                                     fill=FOOD_COLOR, tags="food", outline="black")
+        self._food_dirty = False
 
-    def move_snake(self):
+    def render_frame(self):
+        """
+        Redraws the whole board into the frame buffer and blits it once.
+
+        FRAME_RENDER mode only: a single PhotoImage update replaces all
+        per-item canvas operations, so Tk draw cost does not grow with
+        snake length.
+        """
+        self._photo.put(BACKGROUND_COLOR, to=(0, 0, WIDTH, HEIGHT))
+        for col, row in self.snake:
+            x, y = col * GRID_SIZE, row * GRID_SIZE
+            self._photo.put(SNAKE_COLOR, to=(x, y, x + GRID_SIZE, y + GRID_SIZE))
+        if self.food:
+            col, row = self.food
+            x, y = col * GRID_SIZE, row * GRID_SIZE
+            self._photo.put(FOOD_COLOR, to=(x, y, x + GRID_SIZE, y + GRID_SIZE))
+        if self._frame_item is None:
+            self._frame_item = self.canvas.create_image(0, 0, image=self._photo,
+                                                        anchor='nw')
+
+    def move_snake(self, _GS=GRID_SIZE, _CX=CELLS_X, _CY=CELLS_Y,
+                   _deltas=DIRECTION_DELTAS, _opposites=OPPOSITES,
+                   _step=_step_head, _key=_cell_key):
         """
         Updates the snake's position based on its current direction.
         Handles food eating and collision detection.
+
+        The default arguments bind module globals as fast locals, saving
+        several LOAD_GLOBAL dict lookups on every tick.
         """
         if self.game_over_state or not self.game_running:
             return
 
-        head_x, head_y = self.snake[0]
-        new_head_x, new_head_y = head_x, head_y
+        # Apply at most one buffered direction change per tick, validated
+        # against the direction actually moved last tick so that two fast
+        # key presses cannot sneak in a reversal between ticks.
+        if (self.pending_direction
+                and _opposites[self.pending_direction] != self.last_moved_direction):
+            self.direction = self.pending_direction
+        self.pending_direction = None
 
-        if self.direction == 'Up':
-            new_head_y -= GRID_SIZE
-        elif self.direction == 'Down':
-            new_head_y += GRID_SIZE
-        elif self.direction == 'Left':
-            new_head_x -= GRID_SIZE
-        elif self.direction == 'Right':
-            new_head_x += GRID_SIZE
-
-        new_head = (new_head_x, new_head_y)
+        head_col, head_row = self.snake[0]
+        dx, dy = _deltas[self.direction]
+        new_col, new_row, hit_wall = _step(head_col, head_row, dx, dy, _CX, _CY)
+        new_head = (new_col, new_row)
+        self.last_moved_direction = self.direction
 
         # Check for collisions before adding new head
-        if self.check_collisions(new_head):
+        if hit_wall or self.check_collisions(new_head):
             self.game_over()
             return
 
+        new_key = _key(new_col, new_row)
         self.snake.appendleft(new_head) # Add new head
-
-        # Check if food is eaten
-        if new_head == self.food:
+        self.snake_set.add(new_key)
+        self.free_cells.discard(new_key)
+
+        ate = new_head == self.food
+        # Only a cell that truly became free this tick may short-circuit
+        # check_collisions; grow and tail-chase ticks vacate nothing.
+        self._just_vacated = None
+        if not ate:
+            tail = self.snake.pop() # Remove tail if no food eaten
+            tail_key = _key(*tail)
+            # On a tail-chase move the head enters the very cell the tail
+            # leaves, so the key was just re-added for the head and must
+            # stay in the occupancy set -- and out of the free set.
+            if tail_key != new_key:
+                self.snake_set.discard(tail_key)
+                self.free_cells.add(tail_key)
+                self._just_vacated = tail
+
+        if not FRAME_RENDER:
+            x, y = new_col * _GS, new_row * _GS
+            if ate:
+                item = self.canvas.create_rectangle(x, y, x + _GS, y + _GS,
+                                                    fill=SNAKE_COLOR, tags="snake", outline="black")
+            else:
+                # Recycle the popped tail rectangle as the new head: one
+                # coords() call instead of a delete/create pair, so the Tk
+                # item table sees no churn on the common non-grow tick
+                item = self.snake_items.pop()
+                self.canvas.coords(item, x, y, x + _GS, y + _GS)
+            self.snake_items.appendleft(item)
+
+        if ate:
             self.score += 1
             self.score_label.config(text=f"Score: {self.score}")
             self.place_food() # Place new food
-        else:
-            self.snake.pop() # Remove tail if no food eaten
 
-        self.create_objects() # Redraw snake and food
+        if FRAME_RENDER:
+            self.render_frame()
 
-    def check_collisions(self, head):
+    def check_collisions(self, head, _key=_cell_key):
         """
-        Checks for collisions with walls or the snake's own body.
+        Checks for collisions with the snake's own body.
+
+        Wall collisions are detected by _step_head alongside the head
+        advance.
 
         Args:
-            head: The (x, y) coordinates of the snake's new head.
+            head: The (col, row) grid cell of the snake's new head.
 
         Returns:
             True if a collision occurs, False otherwise.
         """
-        head_x, head_y = head
-
-        # Wall collision
-        if not (0 <= head_x < WIDTH and 0 <= head_y < HEIGHT):
-            return True
-
-        # Self-collision (check if new head is in any existing body segment)
-        # Start checking from the 4th segment to avoid immediate self-collision on turns
-        if head in list(self.snake)[1:]: # Convert deque to list for easier slicing
-            return True
-
-        return False
-
-    def place_food(self):
+        # The cell the tail vacated last tick is known-free: short-circuit
+        # before hashing into the occupancy set. (The head is the only
+        # thing that occupies new cells, and it can never sit where the
+        # next head lands, so this cell cannot have been re-occupied.)
+        if head == self._just_vacated:
+            return False
+
+        # Self-collision: O(1) set lookup instead of scanning the body.
+        # The current tail is exempt because it moves away this same tick.
+        return _key(*head) in self.snake_set and head != self.snake[-1]
+
+    def place_food(self, _CY=CELLS_Y):
         """
-        Places food at a random valid position on the canvas.
-        Ensures food does not spawn on the snake's body.
+        Places food at a random unoccupied position on the canvas.
+
+        Draws a single uniform sample from the free-cell set instead of
+        rejection-sampling against the snake's body. If the board is
+        full, food is set to None.
         """
-        while True:
-            x = random.randint(0, (WIDTH // GRID_SIZE) - 1) * GRID_SIZE
-            y = random.randint(0, (HEIGHT // GRID_SIZE) - 1) * GRID_SIZE
-            new_food_pos = (x, y)
-            if new_food_pos not in self.snake: # Ensure food doesn't spawn on snake
-                self.food = new_food_pos
-                break
+        if self.free_cells:
+            key = random.choice(list(self.free_cells))
+            self.food = (key // _CY, key % _CY)
+        else:
+            self.food = None
+        self._food_dirty = True
+        if not FRAME_RENDER: # Frame mode paints food in render_frame instead
+            self.draw_food()
 
     def change_direction(self, new_direction):
         """
-        Changes the snake's direction based on key press.
-        Prevents the snake from immediately reversing direction.
+        Buffers a direction change from a key press.
+
+        The change is validated and applied in move_snake, so multiple
+        presses between ticks cannot reverse the snake into itself.
         """
         if self.game_over_state or not self.game_running:
             return
 
-        # Prevent immediate reversal
-        if new_direction == 'Left' and self.direction != 'Right':
-            self.direction = new_direction
-        elif new_direction == 'Right' and self.direction != 'Left':
-            self.direction = new_direction
-        elif new_direction == 'Up' and self.direction != 'Down':
-            self.direction = new_direction
-        elif new_direction == 'Down' and self.direction != 'Up':
-            self.direction = new_direction
+        self.pending_direction = new_direction
 
     def game_over(self):
         """
@@ -246,8 +409,11 @@ class SnakeGame:
         """
         if not self.game_over_state and self.game_running:
             self.move_snake()
-            # Schedule the next update
-            self.game_loop_id = self.master.after(GAME_SPEED, self.game_loop)
+            # Schedule against an absolute deadline so per-tick work does
+            # not accumulate as drift in the tick rate
+            self._next_deadline += GAME_SPEED / 1000
+            delay_ms = max(1, int((self._next_deadline - time.monotonic()) * 1000))
+            self.game_loop_id = self._schedule(delay_ms, self.game_loop)
         elif self.game_over_state:
             # If game is over, ensure any pending after calls are cancelled
             if hasattr(self, 'game_loop_id'):